@@ -4,12 +4,15 @@ Furu: cacheable, nested pipelines as config objects.
 This package uses a src-layout. Import the package as `furu`.
 """
 
-from importlib.metadata import version
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-import chz
-import submitit
+if TYPE_CHECKING:
+    import chz
+    import submitit
 
-__version__ = version("furu")
+    __version__: str
 
 from .config import FURU_CONFIG, FuruConfig, get_furu_root, set_furu_root
 from .adapters import SubmititAdapter
@@ -90,3 +93,22 @@ __all__ = [
     "set_furu_root",
     "submitit",
 ]
+
+# Re-exported third-party modules, imported on first access (PEP 562) so that
+# `import furu` does not pay for submitit unless job submission is used.
+# `__version__` is resolved lazily too since package metadata lookup scans sys.path.
+_LAZY_MODULES = {"chz": "chz", "submitit": "submitit"}
+
+
+def __getattr__(name: str) -> ModuleType | str:
+    if name == "__version__":
+        from importlib.metadata import version
+
+        resolved = version("furu")
+        globals()["__version__"] = resolved
+        return resolved
+    if name in _LAZY_MODULES:
+        module = import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,9 @@ from typing import Literal, cast
 
 RecordGitMode = Literal["ignore", "cached", "uncached"]
 
+_TRUTHY = frozenset({"1", "true", "yes"})
+_RECORD_GIT_MODES = frozenset({"ignore", "cached", "uncached"})
+
 
 class FuruConfig:
     """Central configuration for Furu behavior."""
@@ -14,6 +17,11 @@ class FuruConfig:
     VERSION_CONTROLLED_SUBDIR = DEFAULT_ROOT_DIR / "artifacts"
 
     def __init__(self):
+        # get_root() caches: the data root is reset whenever base_root changes,
+        # and the version-controlled root is keyed on the cwd it was resolved from
+        self._data_root: Path | None = None
+        self._version_controlled_root: tuple[str, Path] | None = None
+
         def _get_base_root() -> Path:
             env = os.getenv("FURU_PATH")
             if env:
@@ -40,11 +48,7 @@ class FuruConfig:
         )
         self.max_requeues = int(os.getenv("FURU_PREEMPT_MAX", "5"))
         self.max_compute_retries = int(os.getenv("FURU_MAX_COMPUTE_RETRIES", "3"))
-        self.retry_failed = os.getenv("FURU_RETRY_FAILED", "1").lower() in {
-            "1",
-            "true",
-            "yes",
-        }
+        self.retry_failed = self._parse_bool(os.getenv("FURU_RETRY_FAILED", "1"))
         self.record_git = self._parse_record_git(os.getenv("FURU_RECORD_GIT", "cached"))
         self.allow_no_git_origin = self._parse_bool(
             os.getenv("FURU_ALLOW_NO_GIT_ORIGIN", "0")
@@ -70,24 +74,39 @@ class FuruConfig:
             }
         self._require_namespaces_exist(always_rerun_items)
         self.always_rerun = always_rerun_items
-        self.cancelled_is_preempted = os.getenv(
-            "FURU_CANCELLED_IS_PREEMPTED", "false"
-        ).lower() in {"1", "true", "yes"}
+        self.cancelled_is_preempted = self._parse_bool(
+            os.getenv("FURU_CANCELLED_IS_PREEMPTED", "false")
+        )
+        self.dashboard_scan_ttl_sec = float(
+            os.getenv("FURU_DASHBOARD_SCAN_TTL_SECS", "2")
+        )
+        # Sequential reads are fastest on local disks; raise for network FS
+        self.dashboard_scan_workers = max(
+            1, int(os.getenv("FURU_DASHBOARD_SCAN_WORKERS", "1"))
+        )
 
     @staticmethod
     def _parse_bool(value: str) -> bool:
-        return value.strip().lower() in {"1", "true", "yes"}
+        return value.strip().lower() in _TRUTHY
 
     @classmethod
     def _parse_record_git(cls, value: str) -> RecordGitMode:
         normalized = value.strip().lower()
-        allowed = {"ignore", "cached", "uncached"}
-        if normalized not in allowed:
+        if normalized not in _RECORD_GIT_MODES:
             raise ValueError(
                 "FURU_RECORD_GIT must be one of 'ignore', 'cached', or 'uncached'"
             )
         return cast(RecordGitMode, normalized)
 
+    @property
+    def base_root(self) -> Path:
+        return self._base_root
+
+    @base_root.setter
+    def base_root(self, value: Path) -> None:
+        self._base_root = value
+        self._data_root = None
+
     @property
     def cache_metadata_ttl_sec(self) -> float | None:
         if self.record_git == "cached":
@@ -99,8 +118,15 @@ class FuruConfig:
         if version_controlled:
             if self.version_controlled_root_override is not None:
                 return self.version_controlled_root_override
-            return self._resolve_version_controlled_root()
-        return self.base_root / "data"
+            cwd = os.getcwd()
+            cached = self._version_controlled_root
+            if cached is None or cached[0] != cwd:
+                cached = (cwd, self._resolve_version_controlled_root())
+                self._version_controlled_root = cached
+            return cached[1]
+        if self._data_root is None:
+            self._data_root = self.base_root / "data"
+        return self._data_root
 
     def get_submitit_root(self) -> Path:
         return self.submitit_root
@@ -29,7 +29,6 @@ from typing import (
 )
 
 import chz
-import submitit
 from chz.field import Field as ChzField
 from typing_extensions import dataclass_transform
 
@@ -1193,6 +1192,8 @@ class Furu[T](ABC):
 
         # Only call submitit.JobEnvironment() when actually in a submitit job
         if slurm_id:
+            import submitit
+
             env = submitit.JobEnvironment()
             info["backend"] = "submitit"
             info["slurm_job_id"] = str(getattr(env, "job_id", slurm_id))
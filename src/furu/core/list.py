@@ -1,3 +1,4 @@
+import weakref
 from typing import (
     Generator,
     Generic,
@@ -12,12 +13,57 @@ from .furu import Furu
 
 _H = TypeVar("_H", bound=Furu, covariant=True)
 
+# What by_name can return: a Furu entry, or a whole dict/list group by its name
+_NamedEntry = Furu | dict[str, Furu] | list[Furu]
+
+# Per-class name -> entry lookup for FuruList.by_name
+_NAME_INDEX: "weakref.WeakKeyDictionary[type, dict[str, _NamedEntry]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Per-class deduplicated entries for FuruList.all / iteration
+_ENTRIES: "weakref.WeakKeyDictionary[type, tuple[Furu, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class _FuruListMeta(type):
     """Metaclass that provides collection methods for FuruList subclasses."""
 
-    def _entries(cls: "type[FuruList[_H]]") -> list[_H]:
-        """Collect all Furu instances from class attributes."""
+    def __setattr__(cls, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        _NAME_INDEX.pop(cls, None)
+        _ENTRIES.pop(cls, None)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        _NAME_INDEX.pop(cls, None)
+        _ENTRIES.pop(cls, None)
+
+    def _name_index(cls: "type[FuruList[_H]]") -> dict[str, _NamedEntry]:
+        """Map names to entries, built once per class and reset on attribute changes."""
+        index = _NAME_INDEX.get(cls)
+        if index is not None:
+            return index
+
+        index: dict[str, _NamedEntry] = {}
+        # Nested dict entries, first definition wins...
+        for value in cls.__dict__.values():
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    index.setdefault(key, item)
+        # ...and direct attributes take precedence over nested entries
+        for name, value in cls.__dict__.items():
+            if value and not callable(value) and not name.startswith("_"):
+                index[name] = value
+        _NAME_INDEX[cls] = index
+        return index
+
+    def _entries(cls: "type[FuruList[_H]]") -> tuple[_H, ...]:
+        """Collect all Furu instances from class attributes, once per class."""
+        cached = _ENTRIES.get(cls)
+        if cached is not None:
+            return cast(tuple[_H, ...], cached)
+
         items: list[_H] = []
         seen: set[str] = set()
 
@@ -44,7 +90,9 @@ class _FuruListMeta(type):
             else:
                 maybe_add(value)
 
-        return items
+        entries = tuple(items)
+        _ENTRIES[cls] = entries
+        return entries
 
     def __iter__(cls: "type[FuruList[_H]]") -> Iterator[_H]:
         """Iterate over all Furu instances."""
@@ -52,7 +100,7 @@ class _FuruListMeta(type):
 
     def all(cls: "type[FuruList[_H]]") -> list[_H]:
         """Get all Furu instances as a list."""
-        return cls._entries()
+        return list(cls._entries())
 
     def items_iter(
         cls: "type[FuruList[_H]]",
@@ -80,14 +128,9 @@ class _FuruListMeta(type):
 
     def by_name(cls: "type[FuruList[_H]]", name: str, *, strict: bool = True):
         """Get Furu instance by name."""
-        attr = cls.__dict__.get(name)
-        if attr and not callable(attr) and not name.startswith("_"):
-            return cast(_H, attr)
-
-        # Check nested dicts
-        for value in cls.__dict__.values():
-            if isinstance(value, dict) and name in value:
-                return cast(_H, value[name])
+        index = cls._name_index()
+        if name in index:
+            return cast(_H, index[name])
 
         if strict:
             raise KeyError(f"{cls.__name__} has no entry named '{name}'")
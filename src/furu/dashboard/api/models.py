@@ -1,4 +1,8 @@
-"""Pydantic models for the Dashboard API."""
+"""Pydantic models for the Dashboard API.
+
+These models also define the OpenAPI schema that the frontend client is
+generated from (`make frontend-generate`), so keep them as pydantic models.
+"""
 
 from typing import Any
 
@@ -66,6 +70,8 @@ class ExperimentList(BaseModel):
 
     experiments: list[ExperimentSummary]
     total: int
+    # Pass as `cursor` to fetch the next page; None on the last page
+    next_cursor: str | None = None
 
 
 class StatusCount(BaseModel):
@@ -1,10 +1,17 @@
 """API route definitions for the Furu Dashboard."""
 
-from fastapi import APIRouter, HTTPException, Query
+import base64
+import binascii
+import json
+
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel
 
 from .. import __version__
 from ..scanner import (
-    scan_experiments,
+    ExperimentCursor,
+    experiment_cursor,
+    scan_experiment_page,
     get_experiment_detail,
     get_stats,
     get_experiment_dag,
@@ -22,6 +29,16 @@ from .models import (
 router = APIRouter(prefix="/api", tags=["api"])
 
 
+def _model_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model with pydantic-core's JSON encoder.
+
+    Returning a Response skips FastAPI's dump/re-validate/json.dumps round trip;
+    `response_model` on the route still documents the schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @router.get("/health", response_model=HealthCheck)
 async def health_check() -> HealthCheck:
     """Health check endpoint."""
@@ -59,10 +76,17 @@ async def list_experiments(
     ),
     view: str = Query("resolved", description="View mode: resolved or original"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
-) -> ExperimentList:
+    offset: int = Query(
+        0, ge=0, description="Offset for pagination (prefer `cursor` for deep pages)"
+    ),
+    cursor: str | None = Query(
+        None, description="Continue after a previous page's `next_cursor`"
+    ),
+) -> Response:
     """List all experiments with optional filtering."""
-    experiments = scan_experiments(
+    after = _decode_cursor(cursor) if cursor is not None else None
+    # Fetch one extra experiment to know whether there is a next page
+    experiments, total = scan_experiment_page(
         result_status=result_status,
         attempt_status=attempt_status,
         namespace_prefix=namespace,
@@ -77,13 +101,35 @@ async def list_experiments(
         migration_kind=migration_kind,
         migration_policy=migration_policy,
         view=view,
+        limit=limit + 1,
+        offset=offset,
+        after=after,
+    )
+
+    next_cursor: str | None = None
+    if len(experiments) > limit:
+        experiments = experiments[:limit]
+        next_cursor = _encode_cursor(experiment_cursor(experiments[-1]))
+
+    return _model_response(
+        ExperimentList(experiments=experiments, total=total, next_cursor=next_cursor)
     )
 
-    # Apply pagination
-    total = len(experiments)
-    experiments = experiments[offset : offset + limit]
 
-    return ExperimentList(experiments=experiments, total=total)
+def _encode_cursor(after: ExperimentCursor) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(after)).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> ExperimentCursor:
+    try:
+        updated_at, furu_hash = json.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    if not (isinstance(updated_at, str) or updated_at is None) or not isinstance(
+        furu_hash, str
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return (updated_at, furu_hash)
 
 
 @router.get(
@@ -94,12 +140,12 @@ async def get_experiment_relationships_route(
     namespace: str,
     furu_hash: str,
     view: str = Query("resolved", description="View mode: resolved or original"),
-) -> ExperimentRelationships:
+) -> Response:
     """Get parent and child relationships for a specific experiment."""
     relationships = get_experiment_relationships(namespace, furu_hash, view=view)
     if relationships is None:
         raise HTTPException(status_code=404, detail="Experiment not found")
-    return relationships
+    return _model_response(relationships)
 
 
 @router.get(
@@ -109,22 +155,22 @@ async def get_experiment(
     namespace: str,
     furu_hash: str,
     view: str = Query("resolved", description="View mode: resolved or original"),
-) -> ExperimentDetail:
+) -> Response:
     """Get detailed information about a specific experiment."""
     experiment = get_experiment_detail(namespace, furu_hash, view=view)
     if experiment is None:
         raise HTTPException(status_code=404, detail="Experiment not found")
-    return experiment
+    return _model_response(experiment)
 
 
 @router.get("/stats", response_model=DashboardStats)
-async def dashboard_stats() -> DashboardStats:
+async def dashboard_stats() -> Response:
     """Get aggregate statistics for the dashboard."""
-    return get_stats()
+    return _model_response(get_stats())
 
 
 @router.get("/dag", response_model=ExperimentDAG)
-async def experiment_dag() -> ExperimentDAG:
+async def experiment_dag() -> Response:
     """Get the experiment dependency DAG.
 
     Returns a graph structure where:
@@ -132,4 +178,4 @@ async def experiment_dag() -> ExperimentDAG:
     - Multiple experiments of the same class are grouped into a single node
     - Edges represent dependencies between classes
     """
-    return get_experiment_dag()
+    return _model_response(get_experiment_dag())
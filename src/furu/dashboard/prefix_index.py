@@ -0,0 +1,26 @@
+"""Matching namespaces against several accepted prefixes at once."""
+
+import re
+from collections.abc import Iterable
+
+
+class PrefixMatcher:
+    """
+    Check whether a namespace starts with any of a set of prefixes.
+
+    The prefixes are compiled into one anchored regex alternation, so each
+    check is a single `re.match` call instead of a Python loop over prefixes.
+    """
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        self.prefixes = tuple(dict.fromkeys(prefixes))
+        if not self.prefixes:
+            raise ValueError("PrefixMatcher needs at least one prefix")
+        self._pattern = re.compile("|".join(map(re.escape, self.prefixes)))
+
+    def match(self, namespace: str) -> bool:
+        """Return True if `namespace` starts with one of the prefixes."""
+        return self._pattern.match(namespace) is not None
+
+    def __repr__(self) -> str:
+        return f"PrefixMatcher({list(self.prefixes)!r})"
@@ -1,14 +1,24 @@
 """Filesystem scanner for discovering and parsing Furu experiment state."""
 
 import datetime as _dt
-from collections import defaultdict
-from collections.abc import Iterator
+import functools
+import heapq
+import json
+import operator
+import os
+import stat
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import cast
 
 from ..config import FURU_CONFIG
 from ..storage import MetadataManager, MigrationManager, MigrationRecord, StateAttempt
-from ..storage.state import StateManager, _FuruState
+from ..storage.state import StateManager
 from .api.models import (
     ChildExperiment,
     DAGEdge,
@@ -23,6 +33,7 @@ from .api.models import (
     ParentExperiment,
     StatusCount,
 )
+from .prefix_index import PrefixMatcher
 
 
 def _iter_roots() -> Iterator[Path]:
@@ -62,6 +73,9 @@ def _collect_aliases() -> dict[tuple[str, str, str], list[MigrationRecord]]:
             if migration.overwritten_at is not None:
                 continue
             aliases[_alias_key(migration)].append(migration)
+    # Independent of the filesystem's walk order
+    for records in aliases.values():
+        records.sort(key=lambda record: (record.to_namespace, record.to_hash))
     return aliases
 
 
@@ -76,6 +90,27 @@ def _alias_reference(
     return ref
 
 
+@functools.lru_cache(maxsize=4096)
+def _namespace_to_path(namespace: str) -> str | None:
+    """Convert a dotted namespace to a relative path, or None if it is malformed."""
+    parts = namespace.split(".")
+    if not all(parts) or any("/" in part or "\\" in part for part in parts):
+        return None
+    return os.path.join(*parts)
+
+
+def _existing_experiment_path(
+    root: Path, namespace_path: str, furu_hash: str
+) -> str | None:
+    """Return the experiment directory if it has a state file, using plain strings."""
+    experiment_dir = os.path.join(root, namespace_path, furu_hash)
+    state_file = os.path.join(
+        experiment_dir, StateManager.INTERNAL_DIR, StateManager.STATE_FILE
+    )
+    return experiment_dir if os.path.isfile(state_file) else None
+
+
+@functools.lru_cache(maxsize=4096)
 def _get_class_name(namespace: str) -> str:
     """Extract class name from namespace (last component)."""
     parts = namespace.split(".")
@@ -90,24 +125,79 @@ def _migration_kind(migration: MigrationRecord | None) -> str | None:
     return migration.kind
 
 
-def _override_summary_attempts(
-    summary: ExperimentSummary, state: _FuruState
-) -> ExperimentSummary:
-    attempt = state.attempt
-    return summary.model_copy(
-        update={
-            "attempt_status": attempt.status if attempt else None,
-            "attempt_number": attempt.number if attempt else None,
-            "backend": attempt.backend if attempt else None,
-            "hostname": attempt.owner.hostname if attempt else None,
-            "user": attempt.owner.user if attempt else None,
-            "started_at": attempt.started_at if attempt else None,
-        }
+@dataclass(frozen=True)
+class _StateFields:
+    """The subset of state.json used by list and stats views."""
+
+    result_status: str
+    updated_at: str | None = None
+    attempt_status: str | None = None
+    attempt_number: int | None = None
+    backend: str | None = None
+    hostname: str | None = None
+    user: str | None = None
+    started_at: str | None = None
+
+
+_ABSENT_STATE_FIELDS = _StateFields(result_status="absent")
+
+
+def _decode_state(state_path: Path, raw: bytes) -> JsonDict:
+    """Decode a state file, raising the same errors as `StateManager.read_state`."""
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON in state file: {state_path}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid state file (expected object): {state_path}")
+    if data.get("schema_version") != StateManager.SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported state schema_version (expected {StateManager.SCHEMA_VERSION}): {state_path}"
+        )
+    return data
+
+
+def _read_state_fields(state_path: Path) -> _StateFields:
+    """
+    Read the fields needed for summaries straight from the JSON document.
+
+    Skips full `_FuruState` validation, which dominates scan time for large
+    experiment trees. `get_experiment_detail` uses `StateManager.read_state` instead.
+    """
+    data = _decode_state(state_path, state_path.read_bytes())
+    try:
+        return _state_fields_from_document(data)
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid state schema: {state_path}") from e
+
+
+def _state_fields_from_document(data: JsonDict) -> _StateFields:
+    # _FuruState.result defaults to an absent result
+    result_status = data["result"]["status"] if "result" in data else "absent"
+    updated_at = data.get("updated_at")
+    attempt = data.get("attempt")
+    if attempt is None:
+        return _StateFields(result_status=result_status, updated_at=updated_at)
+
+    # Mirror StateOwner's host/hostname normalization
+    owner = attempt["owner"]
+    hostname = owner.get("hostname")
+    if hostname is None:
+        hostname = owner.get("host")
+    return _StateFields(
+        result_status=result_status,
+        updated_at=updated_at,
+        attempt_status=attempt["status"],
+        attempt_number=attempt.get("number", 1),
+        backend=attempt["backend"],
+        hostname=hostname,
+        user=owner.get("user"),
+        started_at=attempt["started_at"],
     )
 
 
 def _state_to_summary(
-    state: _FuruState,
+    state: _StateFields,
     namespace: str,
     furu_hash: str,
     migration: MigrationRecord | None = None,
@@ -116,20 +206,19 @@ def _state_to_summary(
     original_hash: str | None = None,
 ) -> ExperimentSummary:
     """Convert a Furu state to an experiment summary."""
-    attempt = state.attempt
     return ExperimentSummary(
         namespace=namespace,
         furu_hash=furu_hash,
         class_name=_get_class_name(namespace),
-        result_status=state.result.status,
-        attempt_status=attempt.status if attempt else None,
-        attempt_number=attempt.number if attempt else None,
+        result_status=state.result_status,
+        attempt_status=state.attempt_status,
+        attempt_number=state.attempt_number,
         updated_at=state.updated_at,
-        started_at=attempt.started_at if attempt else None,
+        started_at=state.started_at,
         # Additional fields for filtering
-        backend=attempt.backend if attempt else None,
-        hostname=attempt.owner.hostname if attempt else None,
-        user=attempt.owner.user if attempt else None,
+        backend=state.backend,
+        hostname=state.hostname,
+        user=state.user,
         migration_kind=_migration_kind(migration) if migration else None,
         migration_policy=migration.policy if migration else None,
         migrated_at=migration.migrated_at if migration else None,
@@ -144,18 +233,340 @@ def _state_to_summary(
     )
 
 
-def _find_experiment_dirs(root: Path) -> list[Path]:
-    """Find all directories containing .furu/state.json files."""
-    experiments = []
+def _walk_state_files(root: Path) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield (experiment_dir, state.json stat) for every experiment under root."""
+    # Walk with os.scandir so directory types come from the dirent, and never
+    # descend into .furu itself or other hidden/cache directories.
+    stack = [os.fspath(root)]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            # Unreadable or removed during the walk; skip it like Path.rglob
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name == StateManager.INTERNAL_DIR:
+                    # A symlinked .furu still counts, as it did for Path.rglob
+                    try:
+                        state_stat = os.stat(
+                            os.path.join(entry.path, StateManager.STATE_FILE)
+                        )
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(state_stat.st_mode):
+                        yield dirpath, state_stat
+                elif (
+                    entry.is_dir(follow_symlinks=False)
+                    and not entry.name.startswith(".")
+                    and entry.name != "__pycache__"
+                ):
+                    stack.append(entry.path)
+
+
+def _find_experiment_dirs(root: Path) -> Iterator[Path]:
+    """Yield all directories containing .furu/state.json files."""
+    for dirpath, _ in _walk_state_files(root):
+        yield Path(dirpath)
+
+
+@dataclass(frozen=True)
+class _ExperimentLocation:
+    experiment_dir: Path
+    namespace: str
+    furu_hash: str
+
+
+@dataclass(frozen=True)
+class _ScanSnapshot:
+    scanned_at: float
+    root_mtime_ns: int
+    locations: list[_ExperimentLocation]
+
+
+@dataclass(frozen=True)
+class _ScanEntry:
+    experiment_dir: Path
+    root: Path
+    namespace: str
+    furu_hash: str
+    state: _StateFields
+
+
+# (st_ino, st_mtime_ns, st_size) of a state, migration, or metadata file. State
+# and migration writes go through os.replace(), so each write gets a new inode;
+# mtime and size catch in-place metadata writes.
+_StateStamp = tuple[int, int, int]
+
+# Module-level caches so repeated dashboard requests skip the directory walk and
+# only re-parse state files that changed since the previous request.
+# Keyed by (root, subtree) where subtree is "" for a full walk of the root
+_SCAN_CACHE: dict[tuple[Path, str], _ScanSnapshot] = {}
+_STATE_CACHE: dict[Path, tuple[_StateStamp, _StateFields]] = {}
+# Parsed migration.json / metadata.json, keyed by experiment directory like
+# _STATE_CACHE so they are bounded by (and pruned with) the experiments on disk
+_MIGRATION_CACHE: dict[Path, tuple[_StateStamp, MigrationRecord]] = {}
+_METADATA_CACHE: dict[Path, tuple[_StateStamp, JsonDict]] = {}
+
+# Recent get_experiment_detail misses, so polling a stale (namespace, hash) does
+# not stat every root again. Insertion-ordered for FIFO eviction.
+_MissKey = tuple[Path, Path, str, str]
+_MISS_CACHE: dict[_MissKey, float] = {}
+_MISS_TTL_SEC = 5.0
+_MISS_CACHE_MAX_ENTRIES = 4096
+
+# Aggregate stats keyed by a cheap fingerprint of the storage roots, so stats
+# polling skips even the per-state stat calls until the TTL expires.
+_StatsFingerprint = tuple[tuple[str, int, int], ...]
+_STATS_CACHE: dict[_StatsFingerprint, tuple[float, DashboardStats]] = {}
+_EMPTY_STATS = DashboardStats(
+    total=0,
+    by_result_status=[],
+    by_attempt_status=[],
+    running_count=0,
+    queued_count=0,
+    failed_count=0,
+    success_count=0,
+)
 
-    # Walk the directory tree looking for .furu directories
-    for furu_dir in root.rglob(StateManager.INTERNAL_DIR):
-        if furu_dir.is_dir():
-            state_file = furu_dir / StateManager.STATE_FILE
-            if state_file.is_file():
-                experiments.append(furu_dir.parent)
+# (updated_at, furu_hash) of the last experiment on the previous page
+ExperimentCursor = tuple[str | None, str]
+_SortKey = tuple[bool, str, str]
+
+# (sort key, state, namespace, furu_hash, migration, original_status)
+_Match = tuple[
+    _SortKey,
+    _StateFields,
+    str,
+    str,
+    MigrationRecord | None,
+    str | None,
+]
+
+
+def _sort_key(updated_at: str | None, furu_hash: str) -> _SortKey:
+    """Listing order key (sorted descending); the hash breaks updated_at ties."""
+    return (updated_at is None, updated_at or "", furu_hash)
+
+
+# Shared by every scan so requests do not pay for thread start-up. Replaced
+# (not shut down, as a concurrent scan may still use it) when
+# FURU_CONFIG.dashboard_scan_workers changes; idle threads exit once the old
+# executor is garbage collected.
+_STATE_READ_POOL: tuple[int, ThreadPoolExecutor] | None = None
+_STATE_READ_POOL_LOCK = threading.Lock()
+
+
+def _state_read_pool(workers: int) -> ThreadPoolExecutor:
+    global _STATE_READ_POOL
+    with _STATE_READ_POOL_LOCK:
+        if _STATE_READ_POOL is not None and _STATE_READ_POOL[0] == workers:
+            return _STATE_READ_POOL[1]
+        pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="furu-dashboard-scan"
+        )
+        _STATE_READ_POOL = (workers, pool)
+        return pool
 
-    return experiments
+
+def clear_scan_cache() -> None:
+    """Clear cached directory listings, parsed files, stats, and detail misses."""
+    _SCAN_CACHE.clear()
+    _STATE_CACHE.clear()
+    _STATS_CACHE.clear()
+    _MISS_CACHE.clear()
+    _MIGRATION_CACHE.clear()
+    _METADATA_CACHE.clear()
+
+
+def _remember_miss(key: _MissKey) -> None:
+    _MISS_CACHE.pop(key, None)
+    _MISS_CACHE[key] = time.monotonic()
+    if len(_MISS_CACHE) > _MISS_CACHE_MAX_ENTRIES:
+        del _MISS_CACHE[next(iter(_MISS_CACHE))]
+
+
+def _read_state_cached(
+    experiment_dir: Path, state_stat: os.stat_result | None = None
+) -> _StateFields | None:
+    """
+    Read an experiment's state, re-parsing only when state.json changed.
+
+    `state_stat` can be passed when the caller just stat'ed the state file.
+    """
+    state_path = StateManager.get_state_path(experiment_dir)
+    if state_stat is None:
+        try:
+            state_stat = state_path.stat()
+        except FileNotFoundError:
+            # Removed after the directory listing was cached
+            _STATE_CACHE.pop(experiment_dir, None)
+            return None
+    stamp = (state_stat.st_ino, state_stat.st_mtime_ns, state_stat.st_size)
+    cached = _STATE_CACHE.get(experiment_dir)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    state = _read_state_fields(state_path)
+    _STATE_CACHE[experiment_dir] = (stamp, state)
+    return state
+
+
+def _file_stamp(path: Path) -> _StateStamp | None:
+    try:
+        file_stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _read_cached[T](
+    cache: dict[Path, tuple[_StateStamp, T]],
+    experiment_dir: Path,
+    path: Path,
+    parse: Callable[[bytes], T],
+) -> T | None:
+    """Parse `path` through a per-experiment cache, re-parsing when it changed."""
+    stamp = _file_stamp(path)
+    if stamp is None:
+        cache.pop(experiment_dir, None)
+        return None
+    cached = cache.get(experiment_dir)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = parse(path.read_bytes())
+    cache[experiment_dir] = (stamp, value)
+    return value
+
+
+def _read_migration_cached(experiment_dir: Path) -> MigrationRecord | None:
+    """`MigrationManager.read_migration`, re-parsing only when the file changed."""
+    return _read_cached(
+        _MIGRATION_CACHE,
+        experiment_dir,
+        MigrationManager.get_migration_path(experiment_dir),
+        lambda raw: MigrationRecord.model_validate(json.loads(raw)),
+    )
+
+
+def _read_metadata_cached(experiment_dir: Path) -> JsonDict | None:
+    """
+    `MetadataManager.read_metadata_raw`, re-parsing only when the file changed.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    return _read_cached(
+        _METADATA_CACHE,
+        experiment_dir,
+        MetadataManager.get_metadata_path(experiment_dir),
+        json.loads,
+    )
+
+
+def _forget_removed_experiments(
+    top: Path, locations: list[_ExperimentLocation]
+) -> None:
+    """Drop cached files under `top` for experiments a fresh walk no longer found."""
+    prefix = os.path.join(os.fspath(top), "")
+    present = {location.experiment_dir for location in locations}
+    for cache in (_STATE_CACHE, _MIGRATION_CACHE, _METADATA_CACHE):
+        # Copy the keys: other request threads may be inserting concurrently
+        for experiment_dir in list(cache):
+            if experiment_dir not in present and os.fspath(experiment_dir).startswith(
+                prefix
+            ):
+                cache.pop(experiment_dir, None)
+
+
+def _cached_scan(root: Path, namespace_prefix: str | None = None) -> list[_ScanEntry]:
+    """
+    List experiments under a root together with their parsed state.
+
+    The directory listing is reused until `FURU_CONFIG.dashboard_scan_ttl_sec`
+    elapses or the walked directory's mtime changes; states are revalidated on
+    every call. With `namespace_prefix`, only the matching subtree is walked and
+    only matching states are read.
+    """
+    subtree = _namespace_prefix_subtree(namespace_prefix) if namespace_prefix else ""
+    top = root / subtree if subtree else root
+    try:
+        root_mtime_ns = top.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    now = time.monotonic()
+    snapshot = _SCAN_CACHE.get((root, subtree))
+    # A fresh walk already stat'ed every state file; reuse those results
+    state_stats: list[os.stat_result | None]
+    if (
+        snapshot is None
+        or snapshot.root_mtime_ns != root_mtime_ns
+        or now - snapshot.scanned_at >= FURU_CONFIG.dashboard_scan_ttl_sec
+    ):
+        locations: list[_ExperimentLocation] = []
+        state_stats = []
+        for dirpath, state_stat in _walk_state_files(top):
+            experiment_dir = Path(dirpath)
+            locations.append(
+                _ExperimentLocation(
+                    experiment_dir, *_parse_namespace_from_path(experiment_dir, root)
+                )
+            )
+            state_stats.append(state_stat)
+        # The walk order is filesystem-dependent; sort so that everything
+        # consuming the listing (e.g. which alias wins the original-view
+        # dedup) is deterministic
+        order = sorted(
+            range(len(locations)),
+            key=lambda index: (locations[index].namespace, locations[index].furu_hash),
+        )
+        locations = [locations[index] for index in order]
+        state_stats = [state_stats[index] for index in order]
+        snapshot = _ScanSnapshot(
+            scanned_at=now, root_mtime_ns=root_mtime_ns, locations=locations
+        )
+        _SCAN_CACHE[(root, subtree)] = snapshot
+        _forget_removed_experiments(top, locations)
+    else:
+        locations = snapshot.locations
+        state_stats = [None] * len(locations)
+
+    if namespace_prefix:
+        keep = [
+            index
+            for index, location in enumerate(locations)
+            if location.namespace.startswith(namespace_prefix)
+        ]
+        if len(keep) != len(locations):
+            locations = [locations[index] for index in keep]
+            state_stats = [state_stats[index] for index in keep]
+
+    if not locations:
+        return []
+    experiment_dirs = [location.experiment_dir for location in locations]
+    workers = FURU_CONFIG.dashboard_scan_workers
+    if workers == 1 or len(locations) == 1:
+        states = list(map(_read_state_cached, experiment_dirs, state_stats))
+    else:
+        # State reads are independent and dominated by stat/open/read latency,
+        # which releases the GIL, so fan them out over threads (a win on
+        # network FS; local disks are faster sequentially).
+        states = list(
+            _state_read_pool(workers).map(
+                _read_state_cached, experiment_dirs, state_stats
+            )
+        )
+
+    return [
+        _ScanEntry(
+            experiment_dir=location.experiment_dir,
+            root=root,
+            namespace=location.namespace,
+            furu_hash=location.furu_hash,
+            state=state,
+        )
+        for location, state in zip(locations, states)
+        if state is not None
+    ]
 
 
 def _parse_datetime(value: str | None) -> _dt.datetime | None:
@@ -171,7 +582,15 @@ def _parse_datetime(value: str | None) -> _dt.datetime | None:
 def _read_metadata_with_defaults(
     directory: Path, migration: MigrationRecord | None
 ) -> JsonDict | None:
-    metadata = MetadataManager.read_metadata_raw(directory)
+    return _apply_migration_defaults(
+        MetadataManager.read_metadata_raw(directory), migration
+    )
+
+
+def _apply_migration_defaults(
+    metadata: JsonDict | None, migration: MigrationRecord | None
+) -> JsonDict | None:
+    """Fill alias default values into `furu_obj` without mutating `metadata`."""
     if not metadata or migration is None:
         return metadata
     if migration.kind != "alias" or migration.overwritten_at is not None:
@@ -219,11 +638,46 @@ def _get_nested_value(data: dict, path: str) -> str | int | float | bool | None:
     return None
 
 
+def _scan_entries(namespace_prefix: str | None = None) -> list[_ScanEntry]:
+    """Collect scan entries from every storage root, optionally by namespace prefix."""
+    return [
+        entry
+        for root in _iter_roots()
+        for entry in _cached_scan(root, namespace_prefix)
+    ]
+
+
+def _namespace_prefix_subtree(namespace_prefix: str) -> str:
+    """
+    Directory that holds every namespace starting with `namespace_prefix`.
+
+    The last component may be a partial module/class name, so only the
+    components before it are used. Returns "" when the whole root must be walked.
+    """
+    parent, _, _ = namespace_prefix.rpartition(".")
+    if not parent:
+        return ""
+    return _namespace_to_path(parent) or ""
+
+
+def _namespace_matcher(
+    namespace_prefix: str | None, namespace_prefixes: Sequence[str] | None
+) -> PrefixMatcher | None:
+    """Build the namespace filter; None when it would not filter anything."""
+    if namespace_prefix is not None and namespace_prefixes is not None:
+        raise ValueError("Pass either namespace_prefix or namespace_prefixes, not both")
+    if namespace_prefix is not None:
+        namespace_prefixes = [namespace_prefix]
+    prefixes = [prefix for prefix in namespace_prefixes or () if prefix]
+    return PrefixMatcher(prefixes) if prefixes else None
+
+
 def scan_experiments(
     *,
     result_status: str | None = None,
     attempt_status: str | None = None,
     namespace_prefix: str | None = None,
+    namespace_prefixes: Sequence[str] | None = None,
     backend: str | None = None,
     hostname: str | None = None,
     user: str | None = None,
@@ -235,6 +689,8 @@ def scan_experiments(
     migration_kind: str | None = None,
     migration_policy: str | None = None,
     view: str = "resolved",
+    limit: int | None = None,
+    after: ExperimentCursor | None = None,
 ) -> list[ExperimentSummary]:
     """
     Scan the filesystem for Furu experiments.
@@ -243,6 +699,8 @@ def scan_experiments(
         result_status: Filter by result status (absent, incomplete, success, failed)
         attempt_status: Filter by attempt status (queued, running, success, failed, etc.)
         namespace_prefix: Filter by namespace prefix
+        namespace_prefixes: Filter by several namespace prefixes (any may match);
+            cannot be combined with `namespace_prefix`
         backend: Filter by backend (local, submitit)
         hostname: Filter by hostname
         user: Filter by user who ran the experiment
@@ -252,11 +710,172 @@ def scan_experiments(
         updated_before: Filter experiments updated before this ISO datetime
         config_filter: Filter by config field in format "field.path=value"
         view: "resolved" uses alias metadata; "original" uses original metadata/state.
+        limit: Only return the first `limit` experiments of the sorted result
+        after: Only return experiments sorted after this (updated_at, furu_hash) cursor
 
     Returns:
         List of experiment summaries, sorted by updated_at (newest first)
     """
-    experiments: list[ExperimentSummary] = []
+    experiments, _ = scan_experiment_page(
+        result_status=result_status,
+        attempt_status=attempt_status,
+        namespace_prefix=namespace_prefix,
+        namespace_prefixes=namespace_prefixes,
+        backend=backend,
+        hostname=hostname,
+        user=user,
+        started_after=started_after,
+        started_before=started_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        config_filter=config_filter,
+        migration_kind=migration_kind,
+        migration_policy=migration_policy,
+        view=view,
+        limit=limit,
+        after=after,
+    )
+    return experiments
+
+
+def scan_experiment_page(
+    *,
+    result_status: str | None = None,
+    attempt_status: str | None = None,
+    namespace_prefix: str | None = None,
+    namespace_prefixes: Sequence[str] | None = None,
+    backend: str | None = None,
+    hostname: str | None = None,
+    user: str | None = None,
+    started_after: str | None = None,
+    started_before: str | None = None,
+    updated_after: str | None = None,
+    updated_before: str | None = None,
+    config_filter: str | None = None,
+    migration_kind: str | None = None,
+    migration_policy: str | None = None,
+    view: str = "resolved",
+    limit: int | None = None,
+    offset: int = 0,
+    after: ExperimentCursor | None = None,
+) -> tuple[list[ExperimentSummary], int]:
+    """
+    Return one page of `scan_experiments(...)` plus the total number of matches.
+
+    Only the experiments on the page are summarized and fully sorted. `after`
+    is a keyset cursor (see `experiment_cursor`); `offset` skips experiments
+    after it. The total ignores both.
+    """
+    namespace_matcher = _namespace_matcher(namespace_prefix, namespace_prefixes)
+    # The resolved view never renames experiments, so a single prefix can
+    # narrow the walk itself; the original view filters on the aliased-from
+    # namespace.
+    walk_prefix: str | None = None
+    if (
+        view == "resolved"
+        and namespace_matcher is not None
+        and len(namespace_matcher.prefixes) == 1
+    ):
+        walk_prefix = namespace_matcher.prefixes[0]
+    return _summarize_entries(
+        _scan_entries(walk_prefix),
+        result_status=result_status,
+        attempt_status=attempt_status,
+        namespace_matcher=namespace_matcher,
+        backend=backend,
+        hostname=hostname,
+        user=user,
+        started_after=started_after,
+        started_before=started_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        config_filter=config_filter,
+        migration_kind=migration_kind,
+        migration_policy=migration_policy,
+        view=view,
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
+
+
+def experiment_cursor(experiment: ExperimentSummary) -> ExperimentCursor:
+    """Cursor that continues a listing after `experiment`."""
+    return (experiment.updated_at, experiment.furu_hash)
+
+
+def scan_all(
+    *,
+    result_status: str | None = None,
+    attempt_status: str | None = None,
+    namespace_prefix: str | None = None,
+    namespace_prefixes: Sequence[str] | None = None,
+    backend: str | None = None,
+    hostname: str | None = None,
+    user: str | None = None,
+    started_after: str | None = None,
+    started_before: str | None = None,
+    updated_after: str | None = None,
+    updated_before: str | None = None,
+    config_filter: str | None = None,
+    migration_kind: str | None = None,
+    migration_policy: str | None = None,
+    view: str = "resolved",
+    limit: int | None = None,
+) -> tuple[list[ExperimentSummary], DashboardStats]:
+    """
+    Compute `scan_experiments(...)` and `get_stats()` from a single traversal.
+
+    Filters only apply to the returned summaries; stats always cover every
+    experiment, matching `get_stats()`.
+    """
+    entries = _scan_entries()
+    summaries, _ = _summarize_entries(
+        entries,
+        result_status=result_status,
+        attempt_status=attempt_status,
+        namespace_matcher=_namespace_matcher(namespace_prefix, namespace_prefixes),
+        backend=backend,
+        hostname=hostname,
+        user=user,
+        started_after=started_after,
+        started_before=started_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        config_filter=config_filter,
+        migration_kind=migration_kind,
+        migration_policy=migration_policy,
+        view=view,
+        limit=limit,
+        offset=0,
+        after=None,
+    )
+    return summaries, _stats_from_entries(entries)
+
+
+def _summarize_entries(
+    entries: list[_ScanEntry],
+    *,
+    result_status: str | None,
+    attempt_status: str | None,
+    namespace_matcher: PrefixMatcher | None,
+    backend: str | None,
+    hostname: str | None,
+    user: str | None,
+    started_after: str | None,
+    started_before: str | None,
+    updated_after: str | None,
+    updated_before: str | None,
+    config_filter: str | None,
+    migration_kind: str | None,
+    migration_policy: str | None,
+    view: str,
+    limit: int | None,
+    offset: int,
+    after: ExperimentCursor | None,
+) -> tuple[list[ExperimentSummary], int]:
+    # Summaries are only built for the experiments that survive sorting/limit
+    matches: list[_Match] = []
     seen_original: set[tuple[str, str, str]] = set()
 
     # Parse datetime filters
@@ -271,147 +890,184 @@ def scan_experiments(
     if config_filter and "=" in config_filter:
         config_field, config_value = config_filter.split("=", 1)
 
-    for root in _iter_roots():
-        for experiment_dir in _find_experiment_dirs(root):
-            state = StateManager.read_state(experiment_dir)
-            namespace, furu_hash = _parse_namespace_from_path(experiment_dir, root)
-            migration = MigrationManager.read_migration(experiment_dir)
-            original_status: str | None = None
-            original_state: _FuruState | None = None
-            metadata_dir = experiment_dir
-            alias_active = False
+    for entry in entries:
+        experiment_dir = entry.experiment_dir
+        state = entry.state
+        namespace = entry.namespace
+        furu_hash = entry.furu_hash
+        # The resolved view never renames and keeps each entry's own result
+        # status (aliases only borrow attempt fields), so these predicates can
+        # run before reading the migration record
+        if view == "resolved":
+            if namespace_matcher is not None and not namespace_matcher.match(namespace):
+                continue
+            if result_status and state.result_status != result_status:
+                continue
+        migration = _read_migration_cached(experiment_dir)
+        original_status: str | None = None
+        original_state: _StateFields | None = None
+        metadata_dir = experiment_dir
+        alias_active = False
 
-            if migration is not None and migration.kind == "alias":
-                original_dir = MigrationManager.resolve_dir(migration, target="from")
-                original_state = StateManager.read_state(original_dir)
-                original_status = original_state.result.status
-                alias_active = (
-                    migration.overwritten_at is None
-                    and state.result.status == "migrated"
-                    and original_status == "success"
-                )
-                original_key = (
-                    migration.from_namespace,
-                    migration.from_hash,
-                    migration.from_root,
-                )
-                if view == "original":
-                    if original_key in seen_original:
-                        continue
-                    seen_original.add(original_key)
-                    state = original_state
-                    namespace = migration.from_namespace
-                    furu_hash = migration.from_hash
-                    metadata_dir = original_dir
-                elif alias_active:
-                    metadata_dir = original_dir
-            elif view == "original":
-                original_key = (
-                    namespace,
-                    furu_hash,
-                    MigrationManager.root_kind_for_dir(experiment_dir),
-                )
+        if migration is not None and migration.kind == "alias":
+            original_dir = MigrationManager.resolve_dir(migration, target="from")
+            original_state = _read_state_cached(original_dir) or _ABSENT_STATE_FIELDS
+            original_status = original_state.result_status
+            alias_active = (
+                migration.overwritten_at is None
+                and state.result_status == "migrated"
+                and original_status == "success"
+            )
+            original_key = (
+                migration.from_namespace,
+                migration.from_hash,
+                migration.from_root,
+            )
+            if view == "original":
+                # Entries arrive sorted by (namespace, furu_hash), so the same
+                # alias represents a shared source on every request
                 if original_key in seen_original:
                     continue
                 seen_original.add(original_key)
-
-            summary = _state_to_summary(
-                state,
+                state = original_state
+                namespace = migration.from_namespace
+                furu_hash = migration.from_hash
+                metadata_dir = original_dir
+            elif alias_active:
+                metadata_dir = original_dir
+        elif view == "original":
+            original_key = (
                 namespace,
                 furu_hash,
-                migration=migration,
-                original_status=original_status,
-                original_namespace=migration.from_namespace if migration else None,
-                original_hash=migration.from_hash if migration else None,
+                MigrationManager.root_kind_for_dir(experiment_dir),
+            )
+            if original_key in seen_original:
+                continue
+            seen_original.add(original_key)
+
+        filter_updated_at = state.updated_at
+        if (
+            migration is not None
+            and migration.kind == "alias"
+            and view == "resolved"
+            and alias_active
+            and original_state is not None
+        ):
+            # Resolved aliases report the original's attempt details
+            filter_updated_at = original_state.updated_at
+            state = replace(
+                original_state,
+                result_status=state.result_status,
+                updated_at=state.updated_at,
             )
 
-            if (
-                migration is not None
-                and migration.kind == "alias"
-                and view == "resolved"
-                and alias_active
-                and original_state is not None
-            ):
-                summary = _override_summary_attempts(summary, original_state)
-
-            filter_updated_at = summary.updated_at
-            if (
-                migration is not None
-                and migration.kind == "alias"
-                and view == "resolved"
-                and alias_active
-                and original_state is not None
-            ):
-                filter_updated_at = original_state.updated_at
+        # Apply filters on the raw fields so that rejected experiments never
+        # pay for an ExperimentSummary
+        if result_status and state.result_status != result_status:
+            continue
+        if attempt_status and state.attempt_status != attempt_status:
+            continue
+        if namespace_matcher is not None and not namespace_matcher.match(namespace):
+            continue
+        if backend and state.backend != backend:
+            continue
+        if hostname and state.hostname != hostname:
+            continue
+        if user and state.user != user:
+            continue
+        if migration_kind and (
+            migration is None or _migration_kind(migration) != migration_kind
+        ):
+            continue
+        if migration_policy and (
+            migration is None or migration.policy != migration_policy
+        ):
+            continue
 
-            # Apply filters
-            if result_status and summary.result_status != result_status:
-                continue
-            if attempt_status and summary.attempt_status != attempt_status:
-                continue
-            if namespace_prefix and not summary.namespace.startswith(namespace_prefix):
-                continue
-            if backend and summary.backend != backend:
-                continue
-            if hostname and summary.hostname != hostname:
-                continue
-            if user and summary.user != user:
-                continue
-            if migration_kind and summary.migration_kind != migration_kind:
-                continue
-            if migration_policy and summary.migration_policy != migration_policy:
+        # Date filters
+        if started_after_dt or started_before_dt:
+            started_dt = _parse_datetime(state.started_at)
+            if started_dt:
+                if started_after_dt and started_dt < started_after_dt:
+                    continue
+                if started_before_dt and started_dt > started_before_dt:
+                    continue
+            elif started_after_dt or started_before_dt:
+                # No started_at but we're filtering by it - exclude
                 continue
 
-            # Date filters
-            if started_after_dt or started_before_dt:
-                started_dt = _parse_datetime(summary.started_at)
-                if started_dt:
-                    if started_after_dt and started_dt < started_after_dt:
-                        continue
-                    if started_before_dt and started_dt > started_before_dt:
-                        continue
-                elif started_after_dt or started_before_dt:
-                    # No started_at but we're filtering by it - exclude
+        if updated_after_dt or updated_before_dt:
+            updated_dt = _parse_datetime(filter_updated_at)
+            if updated_dt:
+                if updated_after_dt and updated_dt < updated_after_dt:
                     continue
-
-            if updated_after_dt or updated_before_dt:
-                updated_dt = _parse_datetime(filter_updated_at)
-                if updated_dt:
-                    if updated_after_dt and updated_dt < updated_after_dt:
-                        continue
-                    if updated_before_dt and updated_dt > updated_before_dt:
-                        continue
-                elif updated_after_dt or updated_before_dt:
-                    # No updated_at but we're filtering by it - exclude
+                if updated_before_dt and updated_dt > updated_before_dt:
                     continue
+            elif updated_after_dt or updated_before_dt:
+                # No updated_at but we're filtering by it - exclude
+                continue
 
-            # Config field filter - requires reading metadata
-            if config_field and config_value is not None:
-                defaults_migration = migration if view == "resolved" else None
-                metadata = _read_metadata_with_defaults(
-                    metadata_dir,
-                    defaults_migration,
-                )
-                if metadata:
-                    furu_obj = metadata.get("furu_obj")
-                    if isinstance(furu_obj, dict):
-                        actual_value = _get_nested_value(furu_obj, config_field)
-                        if str(actual_value) != config_value:
-                            continue
-                    else:
+        # Config field filter - requires reading metadata
+        if config_field and config_value is not None:
+            defaults_migration = migration if view == "resolved" else None
+            metadata = _apply_migration_defaults(
+                _read_metadata_cached(metadata_dir),
+                defaults_migration,
+            )
+            if metadata:
+                furu_obj = metadata.get("furu_obj")
+                if isinstance(furu_obj, dict):
+                    actual_value = _get_nested_value(furu_obj, config_field)
+                    if str(actual_value) != config_value:
                         continue
                 else:
                     continue
+            else:
+                continue
 
-            experiments.append(summary)
-
-    # Sort by updated_at (newest first), with None values at the end
-    experiments.sort(
-        key=lambda e: (e.updated_at is None, e.updated_at or ""),
-        reverse=True,
-    )
+        matches.append(
+            (
+                _sort_key(state.updated_at, furu_hash),
+                state,
+                namespace,
+                furu_hash,
+                migration,
+                original_status,
+            )
+        )
 
-    return experiments
+    total = len(matches)
+    candidates: Iterable[_Match] = matches
+    if after is not None:
+        after_key = _sort_key(*after)
+        candidates = (match for match in matches if match[0] < after_key)
+
+    # Sort by updated_at (newest first); experiments without one sort first.
+    # updated_at lives inside state.json and does not follow the file mtime
+    # (migrations and copies keep it), so the page cannot be picked from stat()
+    # results alone. Stream the cheap match tuples through a bounded heap
+    # instead, and only summarize what ends up on the page.
+    sort_key = operator.itemgetter(0)
+    if limit is not None:
+        matches = heapq.nlargest(offset + limit, candidates, key=sort_key)
+    else:
+        matches = sorted(candidates, key=sort_key, reverse=True)
+    if offset:
+        matches = matches[offset:]
+
+    page = [
+        _state_to_summary(
+            state,
+            namespace,
+            furu_hash,
+            migration=migration,
+            original_status=original_status,
+            original_namespace=migration.from_namespace if migration else None,
+            original_hash=migration.from_hash if migration else None,
+        )
+        for _, state, namespace, furu_hash, migration, original_status in matches
+    ]
+    return page, total
 
 
 def get_experiment_detail(
@@ -431,55 +1087,68 @@ def get_experiment_detail(
     Returns:
         Experiment detail or None if not found
     """
-    # Convert namespace to path
-    namespace_path = Path(*namespace.split("."))
-    alias_reference = _alias_reference(_collect_aliases())
+    namespace_path = _namespace_to_path(namespace)
+    if namespace_path is None:
+        return None
 
-    for root in _iter_roots():
-        experiment_dir = root / namespace_path / furu_hash
-        state_path = StateManager.get_state_path(experiment_dir)
+    miss_key = (
+        FURU_CONFIG.get_root(False),
+        FURU_CONFIG.get_root(True),
+        namespace,
+        furu_hash,
+    )
+    missed_at = _MISS_CACHE.get(miss_key)
+    miss_ttl = min(_MISS_TTL_SEC, FURU_CONFIG.dashboard_scan_ttl_sec)
+    if missed_at is not None and time.monotonic() - missed_at < miss_ttl:
+        return None
 
-        if not state_path.is_file():
+    for root in _iter_roots():
+        found = _existing_experiment_path(root, namespace_path, furu_hash)
+        if found is None:
             continue
 
-        state = StateManager.read_state(experiment_dir)
+        experiment_dir = Path(found)
+        _MISS_CACHE.pop(miss_key, None)
         migration = MigrationManager.read_migration(experiment_dir)
-        metadata = _read_metadata_with_defaults(
-            experiment_dir,
-            migration if view == "resolved" else None,
-        )
+        original_dir: Path | None = None
+        if migration is not None and (
+            migration.kind == "alias"
+            or (
+                view == "original" and migration.kind in {"moved", "copied", "migrated"}
+            )
+        ):
+            original_dir = MigrationManager.resolve_dir(migration, target="from")
         original_status: str | None = None
         original_namespace: str | None = None
         original_hash: str | None = None
 
-        if migration is not None and migration.kind == "alias":
-            original_dir = MigrationManager.resolve_dir(migration, target="from")
-            original_state = StateManager.read_state(original_dir)
-            original_status = original_state.result.status
+        # Read only the state documents the response shows: the original view
+        # replaces the experiment's own state.json with the source's, and a
+        # resolved alias only needs the source's result status.
+        if view == "original" and migration is not None and original_dir is not None:
+            state = StateManager.read_state(original_dir)
+            metadata = MetadataManager.read_metadata_raw(original_dir)
+            experiment_dir = original_dir
+            namespace = migration.from_namespace
+            furu_hash = migration.from_hash
             original_namespace = migration.from_namespace
             original_hash = migration.from_hash
-            if view == "original":
-                state = original_state
-                metadata = MetadataManager.read_metadata_raw(original_dir)
-                experiment_dir = original_dir
-                namespace = original_namespace
-                furu_hash = original_hash
-            else:
-                metadata = _read_metadata_with_defaults(original_dir, migration)
-        elif migration is not None and migration.kind in {
-            "moved",
-            "copied",
-            "migrated",
-        }:
-            if view == "original":
-                original_dir = MigrationManager.resolve_dir(migration, target="from")
-                state = StateManager.read_state(original_dir)
-                metadata = MetadataManager.read_metadata_raw(original_dir)
-                experiment_dir = original_dir
-                namespace = migration.from_namespace
-                furu_hash = migration.from_hash
+            if migration.kind == "alias":
+                original_status = state.result.status
+        else:
+            state = StateManager.read_state(experiment_dir)
+            if migration is not None and original_dir is not None:
+                original_status = (
+                    _read_state_cached(original_dir) or _ABSENT_STATE_FIELDS
+                ).result_status
                 original_namespace = migration.from_namespace
                 original_hash = migration.from_hash
+                metadata = _read_metadata_with_defaults(original_dir, migration)
+            else:
+                metadata = _read_metadata_with_defaults(
+                    experiment_dir,
+                    migration if view == "resolved" else None,
+                )
 
         attempt = state.attempt
         if view == "original" and migration is not None and migration.kind == "alias":
@@ -489,6 +1158,8 @@ def get_experiment_detail(
             alias_source_namespace = namespace
             alias_source_hash = furu_hash
 
+        # Only walk every migration record once the experiment is known to exist
+        alias_reference = _alias_reference(_collect_aliases())
         alias_keys = alias_reference.get(alias_source_namespace, {}).get(
             alias_source_hash,
             [],
@@ -530,6 +1201,7 @@ def get_experiment_detail(
             alias_hashes=alias_hashes,
         )
 
+    _remember_miss(miss_key)
     return None
 
 
@@ -537,39 +1209,50 @@ def get_stats() -> DashboardStats:
     """
     Get aggregate statistics for the dashboard.
 
+    Results are reused for `FURU_CONFIG.dashboard_scan_ttl_sec` as long as the
+    storage roots' mtimes and top-level entry counts are unchanged.
+
     Returns:
         Dashboard statistics including counts by status
     """
-    result_counts: dict[str, int] = defaultdict(int)
-    attempt_counts: dict[str, int] = defaultdict(int)
-    total = 0
-    running = 0
-    queued = 0
-    failed = 0
-    success = 0
-
+    fingerprint = _stats_fingerprint()
+    # Roots with no entries at all cannot hold experiments; skip the walk
+    if all(entry_count == 0 for _, _, entry_count in fingerprint):
+        return _EMPTY_STATS
+    now = time.monotonic()
+    cached = _STATS_CACHE.get(fingerprint)
+    if cached is not None and now - cached[0] < FURU_CONFIG.dashboard_scan_ttl_sec:
+        return cached[1]
+
+    stats = _stats_from_entries(_scan_entries())
+    _STATS_CACHE.clear()
+    _STATS_CACHE[fingerprint] = (now, stats)
+    return stats
+
+
+def _stats_fingerprint() -> _StatsFingerprint:
+    """Fingerprint the storage roots by mtime and number of top-level entries."""
+    fingerprint: list[tuple[str, int, int]] = []
     for root in _iter_roots():
-        for experiment_dir in _find_experiment_dirs(root):
-            state = StateManager.read_state(experiment_dir)
-            total += 1
-
-            result_counts[state.result.status] += 1
-
-            if state.result.status == "success":
-                success += 1
-            elif state.result.status == "failed":
-                failed += 1
-
-            attempt = state.attempt
-            if attempt:
-                attempt_counts[attempt.status] += 1
-                if attempt.status == "running":
-                    running += 1
-                elif attempt.status == "queued":
-                    queued += 1
+        root_path = os.fspath(root)
+        with os.scandir(root_path) as entries:
+            entry_count = sum(1 for _ in entries)
+        fingerprint.append((root_path, os.stat(root_path).st_mtime_ns, entry_count))
+    return tuple(fingerprint)
+
+
+def _stats_from_entries(entries: list[_ScanEntry]) -> DashboardStats:
+    if not entries:
+        return _EMPTY_STATS
+    result_counts = Counter(entry.state.result_status for entry in entries)
+    attempt_counts = Counter(
+        entry.state.attempt_status
+        for entry in entries
+        if entry.state.attempt_status is not None
+    )
 
     return DashboardStats(
-        total=total,
+        total=len(entries),
         by_result_status=[
             StatusCount(status=status, count=count)
             for status, count in sorted(result_counts.items())
@@ -578,10 +1261,10 @@ def get_stats() -> DashboardStats:
             StatusCount(status=status, count=count)
             for status, count in sorted(attempt_counts.items())
         ],
-        running_count=running,
-        queued_count=queued,
-        failed_count=failed,
-        success_count=success,
+        running_count=attempt_counts["running"],
+        queued_count=attempt_counts["queued"],
+        failed_count=result_counts["failed"],
+        success_count=result_counts["success"],
     )
 
 
@@ -648,9 +1331,8 @@ def get_experiment_dag() -> ExperimentDAG:
     edge_set: set[tuple[str, str, str]] = set()  # (source_class, target_class, field)
 
     for root in _iter_roots():
-        for experiment_dir in _find_experiment_dirs(root):
-            state = StateManager.read_state(experiment_dir)
-            namespace, furu_hash = _parse_namespace_from_path(experiment_dir, root)
+        for dirpath, state_stat in _walk_state_files(root):
+            experiment_dir = Path(dirpath)
             metadata = MetadataManager.read_metadata_raw(experiment_dir)
 
             if not metadata:
@@ -668,16 +1350,19 @@ def get_experiment_dag() -> ExperimentDAG:
             if not isinstance(full_class_name, str):
                 continue
 
+            # Reuse the walk's stat of state.json instead of reading it again
+            state = _read_state_cached(experiment_dir, state_stat)
+            if state is None:
+                continue
+            namespace, furu_hash = _parse_namespace_from_path(experiment_dir, root)
+
             # Extract short class name
             short_class_name = full_class_name.split(".")[-1]
             class_info[full_class_name] = short_class_name
 
-            # Get attempt status
-            attempt_status = state.attempt.status if state.attempt else None
-
             # Store experiment info
             experiments_by_class[full_class_name].append(
-                (namespace, furu_hash, state.result.status, attempt_status)
+                (namespace, furu_hash, state.result_status, state.attempt_status)
             )
 
             # Extract dependencies and create edges
@@ -691,8 +1376,12 @@ def get_experiment_dag() -> ExperimentDAG:
 
     # Build nodes
     nodes: list[DAGNode] = []
-    for full_class_name, short_class_name in class_info.items():
-        experiments = experiments_by_class.get(full_class_name, [])
+    # Sorted so the output does not depend on the filesystem's walk order
+    for full_class_name, short_class_name in sorted(class_info.items()):
+        experiments = sorted(
+            experiments_by_class.get(full_class_name, []),
+            key=operator.itemgetter(0, 1),
+        )
 
         # Count statuses
         success_count = sum(1 for _, _, rs, _ in experiments if rs == "success")
@@ -767,7 +1456,8 @@ def _find_experiment_by_furu_obj(
             continue
 
         # Search through experiments of this class
-        for experiment_dir in _find_experiment_dirs(class_dir):
+        for dirpath, state_stat in _walk_state_files(class_dir):
+            experiment_dir = Path(dirpath)
             metadata = MetadataManager.read_metadata_raw(experiment_dir)
             if not metadata:
                 continue
@@ -778,9 +1468,11 @@ def _find_experiment_by_furu_obj(
 
             stored_furu_obj = metadata.get("furu_obj")
             if stored_furu_obj == furu_obj:
+                state = _read_state_cached(experiment_dir, state_stat)
+                if state is None:
+                    continue
                 namespace, furu_hash = _parse_namespace_from_path(experiment_dir, root)
-                state = StateManager.read_state(experiment_dir)
-                return namespace, furu_hash, state.result.status
+                return namespace, furu_hash, state.result_status
 
     return None
 
@@ -802,15 +1494,16 @@ def get_experiment_relationships(
         ExperimentRelationships or None if experiment not found
     """
     # First get the experiment's metadata
-    namespace_path = Path(*namespace.split("."))
+    namespace_path = _namespace_to_path(namespace)
+    if namespace_path is None:
+        return None
 
     target_metadata: JsonDict | None = None
 
     for root in _iter_roots():
-        experiment_dir = root / namespace_path / furu_hash
-        state_path = StateManager.get_state_path(experiment_dir)
-
-        if state_path.is_file():
+        found = _existing_experiment_path(root, namespace_path, furu_hash)
+        if found is not None:
+            experiment_dir = Path(found)
             migration = MigrationManager.read_migration(experiment_dir)
             if (
                 view == "original"
@@ -1,12 +1,25 @@
 import traceback
 from collections.abc import Sequence
 from pathlib import Path
+from typing import ClassVar, Self
 
 
 class _FuruMissing:
-    """Sentinel value for missing fields."""
+    """Sentinel value for missing fields (a singleton, so compare with `is`)."""
 
     __slots__ = ()
+    _instance: ClassVar["_FuruMissing | None"] = None
+
+    def __new__(cls) -> Self:
+        if not isinstance(cls._instance, cls):
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self) -> tuple[type["_FuruMissing"], tuple[()]]:
+        return (_FuruMissing, ())
 
     def __repr__(self) -> str:
         return "Furu.MISSING"
@@ -73,8 +86,12 @@ class FuruComputeError(FuruError):
         self.recorded_error_type = recorded_error_type
         self.recorded_error_message = recorded_error_message
         self.recorded_traceback = recorded_traceback
+        self._str_cache: str | None = None
 
     def __str__(self) -> str:
+        # Formatting the traceback is expensive and loggers may call str() repeatedly.
+        if self._str_cache is not None:
+            return self._str_cache
         msg = super().__str__()  # ty: ignore[invalid-super-argument]
         internal_dir = self.state_path.parent
         furu_dir = internal_dir.parent
@@ -98,14 +115,13 @@ class FuruComputeError(FuruError):
                 and self.original_error.__traceback__ is not None
             ):
                 tb = "".join(
-                    traceback.format_exception(
-                        type(self.original_error),
-                        self.original_error,
-                        self.original_error.__traceback__,
-                    )
+                    traceback.TracebackException.from_exception(
+                        self.original_error
+                    ).format()
                 )
                 msg += f"\n\nTraceback:\n{tb}"
         msg += self._format_hints()
+        self._str_cache = msg
         return msg
 
 
@@ -114,12 +130,16 @@ class FuruMigrationRequired(FuruError):
 
     def __init__(self, message: str, *, state_path: Path | None = None):
         self.state_path = state_path
+        self._str_cache: str | None = None
         super().__init__(message)
 
     def __str__(self) -> str:
+        if self._str_cache is not None:
+            return self._str_cache
         msg = super().__str__()  # ty: ignore[invalid-super-argument]
         if self.state_path is not None:
             msg += f"\n\nState file: {self.state_path}"
+        self._str_cache = msg
         return msg
 
 
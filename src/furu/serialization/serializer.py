@@ -20,6 +20,29 @@ from pydantic import BaseModel as PydanticBaseModel
 JsonValue = Any
 
 
+@runtime_checkable
+class _DependencyHashProvider(Protocol):
+    def _dependency_hashes(self) -> Sequence[str]: ...
+
+
+def _has_required_fields(
+    data_class: type[object],
+    data: dict[str, JsonValue],
+) -> bool:
+    if not chz.is_chz(data_class):
+        return False
+    for field in chz.chz_fields(data_class).values():
+        name = field.logical_name
+        if name in data:
+            continue
+        if field._default is not CHZ_MISSING:
+            continue
+        if not isinstance(field._default_factory, MISSING_TYPE):
+            continue
+        return False
+    return True
+
+
 class FuruSerializer:
     """Handles serialization, deserialization, and hashing of Furu objects."""
 
@@ -91,33 +114,19 @@ class FuruSerializer:
     @classmethod
     def compute_hash(cls, obj: object, verbose: bool = False) -> str:
         """Compute deterministic hash of object."""
-
-        @runtime_checkable
-        class _DependencyHashProvider(Protocol):
-            def _dependency_hashes(self) -> Sequence[str]: ...
-
-        def _has_required_fields(
-            data_class: type[object],
-            data: dict[str, JsonValue],
-        ) -> bool:
-            if not chz.is_chz(data_class):
-                return False
-            for field in chz.chz_fields(data_class).values():
-                name = field.logical_name
-                if name in data:
-                    continue
-                if field._default is not CHZ_MISSING:
-                    continue
-                if not isinstance(field._default_factory, MISSING_TYPE):
-                    continue
-                return False
-            return True
+        # Shared sub-objects (e.g. a dependency used by several fields) are only
+        # canonicalized once per call. Keyed by id(), so the object is stored too
+        # to keep temporaries alive and their ids from being reused.
+        memo: dict[int, tuple[object, JsonValue]] = {}
 
         def canonicalize(item: object) -> JsonValue:
             if isinstance(item, _FuruMissing):
                 raise ValueError("Cannot hash Furu.MISSING")
 
             if chz.is_chz(item):
+                cached = memo.get(id(item))
+                if cached is not None:
+                    return cached[1]
                 fields = chz.chz_fields(item)
                 result = {
                     "__class__": cls.get_classname(item),
@@ -131,6 +140,7 @@ class FuruSerializer:
                     dependency_hashes = list(item._dependency_hashes())
                     if dependency_hashes:
                         result["__dependencies__"] = dependency_hashes
+                memo[id(item)] = (item, result)
                 return result
 
             if isinstance(item, dict):
@@ -16,6 +16,8 @@ Use `temp_furu_root` (function-scoped, slow) when:
 
 The populated fixture creates experiments once per test module and reuses them,
 which is significantly faster than creating experiments for each test.
+Use `populated_hashes` to look up the furu_hash of a populated experiment
+instead of rebuilding the object and hashing it.
 """
 
 from __future__ import annotations
@@ -47,10 +49,15 @@ from .pipelines import (
 )
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    """Shared test client for the FastAPI app.
+
+    The app reads the storage roots from FURU_CONFIG on every request, so one
+    client (and its event loop thread) serves tests with different roots.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -76,6 +83,7 @@ def temp_furu_root(
     monkeypatch.setattr(FURU_CONFIG, "lease_duration_sec", 0.05)
     monkeypatch.setattr(FURU_CONFIG, "heartbeat_interval_sec", 0.01)
     monkeypatch.setattr(FURU_CONFIG, "retry_failed", True)
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_ttl_sec", 0.0)
 
     yield tmp_path
 
@@ -236,9 +244,19 @@ def create_experiment_from_furu(
     return directory
 
 
-def _create_populated_experiments(root: Path) -> None:
+def patch_state(state_path: Path, **updates: object) -> None:
+    """Overwrite top-level fields of a state.json file in place."""
+    data = json.loads(state_path.read_bytes())
+    data.update(updates)
+    state_path.write_bytes(json.dumps(data).encode())
+
+
+def _create_populated_experiments(root: Path) -> dict[str, str]:
     """Create sample experiments in the given root directory.
 
+    Returns the furu_hash of each created experiment keyed by its variable name
+    below (e.g. "dataset1", "train2", "dataset_alias").
+
     Creates experiments with realistic dependencies and varied attributes
     for comprehensive filter testing:
     - PrepareDataset (success, local, gpu-01, alice, 2025-01-01)
@@ -415,9 +433,29 @@ def _create_populated_experiments(root: Path) -> None:
     )
     MigrationManager.write_migration(moved_record, moved_dir)
 
+    created = {
+        "dataset1": dataset1,
+        "train1": train1,
+        "train2": train2,
+        "eval1": eval1,
+        "loader": loader,
+        "dataset2": dataset2,
+        "dataset_alias": dataset_alias,
+        "dataset_alias_second": dataset_alias_second,
+        "moved_dataset": moved_dataset,
+    }
+    return {name: obj.furu_hash for name, obj in created.items()}
+
 
 @pytest.fixture(scope="module")
-def populated_furu_root(_configure_furu_for_module: Path) -> Path:
+def _populated_experiments(_configure_furu_for_module: Path) -> dict[str, str]:
+    return _create_populated_experiments(_configure_furu_for_module)
+
+
+@pytest.fixture(scope="module")
+def populated_furu_root(
+    _configure_furu_for_module: Path, _populated_experiments: dict[str, str]
+) -> Path:
     """Create a module-scoped Furu root with sample experiments.
 
     PREFER THIS FIXTURE for read-only tests. Experiments are created once per
@@ -425,9 +463,18 @@ def populated_furu_root(_configure_furu_for_module: Path) -> Path:
 
     See _create_populated_experiments() for the exact data created.
     """
-    root = _configure_furu_for_module
-    _create_populated_experiments(root)
-    return root
+    return _configure_furu_for_module
+
+
+@pytest.fixture(scope="module")
+def populated_hashes(
+    populated_furu_root: Path, _populated_experiments: dict[str, str]
+) -> dict[str, str]:
+    """furu_hash of each experiment in `populated_furu_root`, by fixture name.
+
+    Use this instead of rebuilding the objects and calling compute_hash.
+    """
+    return _populated_experiments
 
 
 @pytest.fixture
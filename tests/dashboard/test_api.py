@@ -13,10 +13,6 @@ from pathlib import Path
 
 from fastapi.testclient import TestClient
 
-from furu.serialization import FuruSerializer
-
-from .pipelines import PrepareDataset, TrainModel
-
 
 def test_health_check(client: TestClient) -> None:
     """Test health check endpoint."""
@@ -155,11 +151,40 @@ def test_list_experiments_pagination(
     assert len(data["experiments"]) == 2
 
 
-def test_get_experiment_detail(client: TestClient, populated_furu_root: Path) -> None:
+def test_list_experiments_cursor_pagination(
+    client: TestClient, populated_furu_root: Path
+) -> None:
+    """Test that cursor pagination walks the same order as a full listing."""
+    everything = client.get("/api/experiments").json()
+    assert everything["next_cursor"] is None
+    expected = [exp["furu_hash"] for exp in everything["experiments"]]
+
+    seen: list[str] = []
+    cursor: str | None = None
+    while True:
+        params: dict[str, str | int] = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = client.get("/api/experiments", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 9
+        seen.extend(exp["furu_hash"] for exp in data["experiments"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+    response = client.get("/api/experiments?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_get_experiment_detail(
+    client: TestClient, populated_hashes: dict[str, str]
+) -> None:
     """Test getting detailed experiment information."""
-    # Get the hash for a specific experiment
-    dataset1 = PrepareDataset(name="mnist", version="v1")
-    furu_hash = FuruSerializer.compute_hash(dataset1)
+    furu_hash = populated_hashes["dataset1"]
 
     response = client.get(
         f"/api/experiments/dashboard.pipelines.PrepareDataset/{furu_hash}"
@@ -176,8 +201,7 @@ def test_get_experiment_detail(client: TestClient, populated_furu_root: Path) ->
     assert "state" in data
     assert "metadata" in data
 
-    alias = PrepareDataset(name="mnist", version="v2")
-    alias_hash = FuruSerializer.compute_hash(alias)
+    alias_hash = populated_hashes["dataset_alias"]
     alias_response = client.get(
         f"/api/experiments/dashboard.pipelines.PrepareDataset/{alias_hash}?view=resolved"
     )
@@ -192,13 +216,11 @@ def test_get_experiment_detail(client: TestClient, populated_furu_root: Path) ->
 
 
 def test_get_experiment_detail_with_attempt(
-    client: TestClient, populated_furu_root: Path
+    client: TestClient, populated_hashes: dict[str, str]
 ) -> None:
     """Test that experiment detail includes attempt information."""
-    # Get the hash for the running training experiment
-    dataset1 = PrepareDataset(name="mnist", version="v1")
-    train2 = TrainModel(lr=0.0001, steps=2000, dataset=dataset1)
-    furu_hash = FuruSerializer.compute_hash(train2)
+    # The running training experiment
+    furu_hash = populated_hashes["train2"]
 
     response = client.get(
         f"/api/experiments/dashboard.pipelines.TrainModel/{furu_hash}"
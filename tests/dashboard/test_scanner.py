@@ -3,18 +3,30 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 
+import pytest
+
+from furu.config import FURU_CONFIG
+from furu.dashboard.prefix_index import PrefixMatcher
 from furu.dashboard.scanner import (
+    _METADATA_CACHE,
+    _STATE_CACHE,
+    _read_metadata_cached,
+    _state_read_pool,
+    _walk_state_files,
+    clear_scan_cache,
     get_experiment_dag,
     get_experiment_detail,
     get_stats,
+    scan_all,
     scan_experiments,
 )
 from furu.serialization import FuruSerializer
 from furu.storage import MigrationManager
 
-from .conftest import create_experiment_from_furu
+from .conftest import create_experiment_from_furu, patch_state
 from .pipelines import PrepareDataset, TrainModel
 
 
@@ -89,6 +101,53 @@ def test_scan_experiments_filter_namespace(populated_furu_root: Path) -> None:
     assert len(original) == 7
 
 
+def test_scan_experiments_namespace_prefix_matches_full_scan(
+    populated_furu_root: Path,
+) -> None:
+    """Test that subtree walks for a prefix agree with filtering a full scan."""
+    everything = scan_experiments()
+    for prefix in ("dashboard", "dashboard.pipelines.Train", "dashboard.missing.X"):
+        expected = [exp for exp in everything if exp.namespace.startswith(prefix)]
+        assert scan_experiments(namespace_prefix=prefix) == expected
+
+    assert scan_experiments(namespace_prefix="dashboard.pipelines.Train")
+
+
+def test_scan_experiments_filter_multiple_namespace_prefixes(
+    populated_furu_root: Path,
+) -> None:
+    """Test that namespace_prefixes keeps experiments matching any prefix."""
+    prefixes = ["dashboard.pipelines.TrainModel", "dashboard.pipelines.EvalModel"]
+    everything = scan_experiments()
+    expected = [
+        exp
+        for exp in everything
+        if any(exp.namespace.startswith(prefix) for prefix in prefixes)
+    ]
+    assert expected
+    assert scan_experiments(namespace_prefixes=prefixes) == expected
+    assert scan_experiments(
+        namespace_prefixes=["dashboard.pipelines.TrainModel"]
+    ) == scan_experiments(namespace_prefix="dashboard.pipelines.TrainModel")
+
+    with pytest.raises(ValueError, match="not both"):
+        scan_experiments(
+            namespace_prefix="dashboard.pipelines.TrainModel",
+            namespace_prefixes=["dashboard.pipelines.EvalModel"],
+        )
+
+
+def test_prefix_matcher_matches_any_prefix() -> None:
+    """Test that PrefixMatcher anchors at the start and escapes dots."""
+    matcher = PrefixMatcher(["a.b", "c"])
+    assert matcher.match("a.b.Model")
+    assert matcher.match("c.d")
+    assert not matcher.match("axb")
+    assert not matcher.match("x.a.b")
+    with pytest.raises(ValueError, match="at least one prefix"):
+        PrefixMatcher([])
+
+
 def test_scan_experiments_sorted_by_updated_at(temp_furu_root: Path) -> None:
     """Test that experiments are sorted by updated_at (newest first)."""
     # Create experiments with different timestamps
@@ -98,20 +157,18 @@ def test_scan_experiments_sorted_by_updated_at(temp_furu_root: Path) -> None:
     )
 
     # Modify the state file to have an older timestamp
-    older_state = older_dir / ".furu" / "state.json"
-    state_data = json.loads(older_state.read_text())
-    state_data["updated_at"] = "2024-01-01T00:00:00+00:00"
-    older_state.write_text(json.dumps(state_data))
+    patch_state(
+        older_dir / ".furu" / "state.json", updated_at="2024-01-01T00:00:00+00:00"
+    )
 
     newer_dataset = PrepareDataset(name="newer", version="v1")
     newer_dir = create_experiment_from_furu(
         newer_dataset, result_status="success", attempt_status="success"
     )
 
-    newer_state = newer_dir / ".furu" / "state.json"
-    state_data = json.loads(newer_state.read_text())
-    state_data["updated_at"] = "2025-06-01T00:00:00+00:00"
-    newer_state.write_text(json.dumps(state_data))
+    patch_state(
+        newer_dir / ".furu" / "state.json", updated_at="2025-06-01T00:00:00+00:00"
+    )
 
     experiments = scan_experiments()
     assert len(experiments) == 2
@@ -120,11 +177,233 @@ def test_scan_experiments_sorted_by_updated_at(temp_furu_root: Path) -> None:
     assert experiments[1].furu_hash == FuruSerializer.compute_hash(older_dataset)
 
 
-def test_get_experiment_detail_found(populated_furu_root: Path) -> None:
+def test_scan_experiments_picks_up_state_changes(
+    temp_furu_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that cached states are re-read when state.json changes."""
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_ttl_sec", 3600.0)
+    dataset = PrepareDataset(name="cached", version="v1")
+    directory = create_experiment_from_furu(
+        dataset, result_status="incomplete", attempt_status="running"
+    )
+    assert [exp.result_status for exp in scan_experiments()] == ["incomplete"]
+
+    patch_state(directory / ".furu" / "state.json", result={"status": "failed"})
+
+    assert [exp.result_status for exp in scan_experiments()] == ["failed"]
+    assert get_stats().failed_count == 1
+
+
+def test_scan_experiments_reuses_directory_listing(
+    temp_furu_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the directory listing is cached until the TTL expires."""
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_ttl_sec", 3600.0)
+    create_experiment_from_furu(PrepareDataset(name="first", version="v1"))
+    assert len(scan_experiments()) == 1
+
+    create_experiment_from_furu(PrepareDataset(name="second", version="v1"))
+    assert len(scan_experiments()) == 1
+
+    clear_scan_cache()
+    assert len(scan_experiments()) == 2
+
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_ttl_sec", 0.0)
+    create_experiment_from_furu(PrepareDataset(name="third", version="v1"))
+    assert len(scan_experiments()) == 3
+
+
+def test_fresh_walk_forgets_deleted_experiments(temp_furu_root: Path) -> None:
+    """Test that cached states of deleted experiments are dropped on re-walk."""
+    kept = create_experiment_from_furu(PrepareDataset(name="kept", version="v1"))
+    deleted = create_experiment_from_furu(PrepareDataset(name="gone", version="v1"))
+    assert len(scan_experiments()) == 2
+    assert _read_metadata_cached(deleted) is not None
+    assert deleted in _STATE_CACHE
+    assert deleted in _METADATA_CACHE
+
+    shutil.rmtree(deleted)
+    assert [exp.furu_hash for exp in scan_experiments()] == [kept.name]
+    assert deleted not in _STATE_CACHE
+    assert deleted not in _METADATA_CACHE
+    assert kept in _STATE_CACHE
+
+
+def test_get_stats_is_cached_until_ttl_expires(
+    temp_furu_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that stats are reused while the roots look unchanged."""
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_ttl_sec", 3600.0)
+    directory = create_experiment_from_furu(
+        PrepareDataset(name="stats", version="v1"), result_status="success"
+    )
+    assert get_stats().success_count == 1
+
+    patch_state(directory / ".furu" / "state.json", result={"status": "failed"})
+    assert get_stats().success_count == 1
+
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_ttl_sec", 0.0)
+    stats = get_stats()
+    assert stats.success_count == 0
+    assert stats.failed_count == 1
+
+
+def test_scan_experiments_config_filter_sees_metadata_changes(
+    temp_furu_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that cached metadata is re-read when metadata.json changes."""
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_ttl_sec", 3600.0)
+    directory = create_experiment_from_furu(PrepareDataset(name="meta", version="v1"))
+    assert len(scan_experiments(config_filter="name=meta")) == 1
+
+    metadata_path = directory / ".furu" / "metadata.json"
+    metadata = json.loads(metadata_path.read_text())
+    metadata["furu_obj"]["name"] = "renamed"
+    metadata_path.write_text(json.dumps(metadata))
+
+    assert scan_experiments(config_filter="name=meta") == []
+    assert len(scan_experiments(config_filter="name=renamed")) == 1
+
+
+def test_scan_experiments_threaded_reads_reuse_one_pool(
+    populated_furu_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that threaded state reads match sequential ones and share a pool."""
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_workers", 1)
+    clear_scan_cache()
+    sequential = scan_experiments()
+
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_workers", 4)
+    clear_scan_cache()
+    assert scan_experiments() == sequential
+    pool = _state_read_pool(4)
+    assert scan_experiments() == sequential
+    assert _state_read_pool(4) is pool
+
+
+def test_walk_skips_directories_removed_during_walk(temp_furu_root: Path) -> None:
+    """Test that a directory deleted mid-walk is skipped instead of raising."""
+    first = create_experiment_from_furu(PrepareDataset(name="a", version="v1"))
+    second = create_experiment_from_furu(PrepareDataset(name="b", version="v1"))
+    assert first.parent == second.parent
+
+    walk = _walk_state_files(first.parent)
+    yielded, _ = next(walk)
+    remaining = second if yielded == str(first) else first
+    shutil.rmtree(remaining)
+
+    assert list(walk) == []
+
+
+def test_original_view_picks_alias_independent_of_walk_order(
+    populated_furu_root: Path, populated_hashes: dict[str, str]
+) -> None:
+    """Test that the source/alias entry kept for the original view is deterministic."""
+    source_hash = populated_hashes["dataset1"]
+    original = scan_experiments(view="original")
+    sources = [exp for exp in original if exp.furu_hash == source_hash]
+    assert len(sources) == 1
+
+    # All three live in the same namespace, so the smallest hash is seen first
+    first = min(
+        source_hash,
+        populated_hashes["dataset_alias"],
+        populated_hashes["dataset_alias_second"],
+    )
+    assert sources[0].to_hash == (None if first == source_hash else first)
+
+
+def test_walk_follows_symlinked_internal_dir(temp_furu_root: Path) -> None:
+    """Test that an experiment whose .furu is a symlink is still found."""
+    directory = create_experiment_from_furu(PrepareDataset(name="link", version="v1"))
+    internal = directory / ".furu"
+    target = temp_furu_root / "elsewhere"
+    internal.rename(target)
+    internal.symlink_to(target, target_is_directory=True)
+
+    assert [exp.furu_hash for exp in scan_experiments()] == [directory.name]
+
+
+def test_scan_experiments_skips_hidden_directories(temp_furu_root: Path) -> None:
+    """Test that experiment copies under hidden directories are ignored."""
+    directory = create_experiment_from_furu(PrepareDataset(name="kept", version="v1"))
+    hidden_copy = directory.parent / ".trash" / directory.name / ".furu"
+    hidden_copy.mkdir(parents=True)
+    (hidden_copy / "state.json").write_text(
+        (directory / ".furu" / "state.json").read_text()
+    )
+
+    experiments = scan_experiments()
+    assert [exp.furu_hash for exp in experiments] == [directory.name]
+
+
+def test_scan_experiments_reports_corrupt_state_path(temp_furu_root: Path) -> None:
+    """Test that unreadable state files raise ValueErrors naming the file."""
+    directory = create_experiment_from_furu(PrepareDataset(name="bad", version="v1"))
+    state_path = directory / ".furu" / "state.json"
+
+    state_path.write_text("{not json")
+    with pytest.raises(ValueError, match="Invalid JSON in state file") as excinfo:
+        scan_experiments()
+    assert str(state_path) in str(excinfo.value)
+
+    state_path.write_text(json.dumps({"schema_version": 1, "result": {}}))
+    with pytest.raises(ValueError, match="Invalid state schema") as excinfo:
+        scan_experiments()
+    assert str(state_path) in str(excinfo.value)
+
+
+def test_scan_experiments_defaults_missing_result_to_absent(
+    temp_furu_root: Path,
+) -> None:
+    """Test that a state file without a result is listed as absent."""
+    directory = create_experiment_from_furu(PrepareDataset(name="bare", version="v1"))
+    (directory / ".furu" / "state.json").write_text(json.dumps({"schema_version": 1}))
+
+    assert [exp.result_status for exp in scan_experiments()] == ["absent"]
+
+
+def test_scan_experiments_falls_back_to_owner_host(temp_furu_root: Path) -> None:
+    """Test that summaries use owner.host when owner.hostname is missing."""
+    directory = create_experiment_from_furu(
+        PrepareDataset(name="legacy", version="v1"),
+        attempt_status="running",
+        hostname="legacy-host",
+    )
+    state_path = directory / ".furu" / "state.json"
+    state_data = json.loads(state_path.read_text())
+    del state_data["attempt"]["owner"]["hostname"]
+    state_path.write_text(json.dumps(state_data))
+
+    experiments = scan_experiments(hostname="legacy-host")
+    assert len(experiments) == 1
+    assert experiments[0].attempt_number == 1
+
+
+def test_get_experiment_detail_normalizes_legacy_state(temp_furu_root: Path) -> None:
+    """Test that the detail state is the normalized model, not the raw file."""
+    directory = create_experiment_from_furu(
+        PrepareDataset(name="legacy", version="v1"),
+        attempt_status="running",
+        hostname="legacy-host",
+    )
+    state_path = directory / ".furu" / "state.json"
+    state_data = json.loads(state_path.read_text())
+    del state_data["attempt"]["owner"]["hostname"]
+    del state_data["result"]
+    state_path.write_text(json.dumps(state_data))
+
+    (experiment,) = scan_experiments()
+    detail = get_experiment_detail(experiment.namespace, experiment.furu_hash)
+    assert detail is not None
+    owner = detail.state["attempt"]["owner"]
+    assert owner["host"] == owner["hostname"] == "legacy-host"
+    assert detail.state["result"] == {"status": "absent"}
+
+
+def test_get_experiment_detail_found(populated_hashes: dict[str, str]) -> None:
     """Test getting experiment detail."""
-    dataset1 = PrepareDataset(name="mnist", version="v1")
-    dataset2 = PrepareDataset(name="cifar", version="v2")
-    furu_hash = FuruSerializer.compute_hash(dataset1)
+    furu_hash = populated_hashes["dataset1"]
 
     detail = get_experiment_detail("dashboard.pipelines.PrepareDataset", furu_hash)
     assert detail is not None
@@ -135,7 +414,7 @@ def test_get_experiment_detail_found(populated_furu_root: Path) -> None:
     assert "state" in detail.model_dump()
 
     alias = PrepareDataset(name="mnist", version="v2")
-    alias_hash = FuruSerializer.compute_hash(alias)
+    alias_hash = populated_hashes["dataset_alias"]
     alias_detail = get_experiment_detail(
         "dashboard.pipelines.PrepareDataset", alias_hash, view="resolved"
     )
@@ -169,13 +448,13 @@ def test_get_experiment_detail_found(populated_furu_root: Path) -> None:
     assert alias_original is not None
     assert alias_original.furu_hash == furu_hash
 
-    moved = PrepareDataset(name="mnist", version="v3")
-    moved_hash = FuruSerializer.compute_hash(moved)
     moved_original = get_experiment_detail(
-        "dashboard.pipelines.PrepareDataset", moved_hash, view="original"
+        "dashboard.pipelines.PrepareDataset",
+        populated_hashes["moved_dataset"],
+        view="original",
     )
     assert moved_original is not None
-    assert moved_original.furu_hash == FuruSerializer.compute_hash(dataset2)
+    assert moved_original.furu_hash == populated_hashes["dataset2"]
 
 
 def test_get_experiment_detail_not_found(populated_furu_root: Path) -> None:
@@ -184,11 +463,39 @@ def test_get_experiment_detail_not_found(populated_furu_root: Path) -> None:
     assert detail is None
 
 
-def test_get_experiment_detail_includes_attempt(populated_furu_root: Path) -> None:
+def test_get_experiment_detail_caches_misses(
+    temp_furu_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that recent misses are served from the negative cache."""
+    monkeypatch.setattr(FURU_CONFIG, "dashboard_scan_ttl_sec", 3600.0)
+    dataset = PrepareDataset(name="late", version="v1")
+    namespace = "dashboard.pipelines.PrepareDataset"
+    furu_hash = FuruSerializer.compute_hash(dataset)
+    assert get_experiment_detail(namespace, furu_hash) is None
+
+    create_experiment_from_furu(dataset)
+    assert get_experiment_detail(namespace, furu_hash) is None
+
+    clear_scan_cache()
+    detail = get_experiment_detail(namespace, furu_hash)
+    assert detail is not None
+    assert detail.furu_hash == furu_hash
+
+
+def test_get_experiment_detail_rejects_malformed_namespace(
+    populated_hashes: dict[str, str],
+) -> None:
+    """Test that malformed namespaces are rejected without touching the disk."""
+    furu_hash = populated_hashes["dataset1"]
+    for namespace in ("", "dashboard..PrepareDataset", "../dashboard.pipelines"):
+        assert get_experiment_detail(namespace, furu_hash) is None
+
+
+def test_get_experiment_detail_includes_attempt(
+    populated_hashes: dict[str, str],
+) -> None:
     """Test that detail includes attempt information."""
-    dataset1 = PrepareDataset(name="mnist", version="v1")
-    train2 = TrainModel(lr=0.0001, steps=2000, dataset=dataset1)
-    furu_hash = FuruSerializer.compute_hash(train2)
+    furu_hash = populated_hashes["train2"]
 
     detail = get_experiment_detail("dashboard.pipelines.TrainModel", furu_hash)
     assert detail is not None
@@ -225,6 +532,25 @@ def test_get_stats_counts(populated_furu_root: Path) -> None:
     assert result_map["migrated"] == 3
 
 
+def test_scan_all_matches_separate_calls(populated_furu_root: Path) -> None:
+    """Test that scan_all returns the same data as the separate scans."""
+    experiments, stats = scan_all()
+    assert experiments == scan_experiments()
+    assert stats == get_stats()
+
+    filtered, unfiltered_stats = scan_all(result_status="success")
+    assert filtered == scan_experiments(result_status="success")
+    # Stats ignore the filters
+    assert unfiltered_stats.total == 9
+
+
+def test_scan_experiments_limit_keeps_sort_order(populated_furu_root: Path) -> None:
+    """Test that limit returns the head of the full sorted result."""
+    experiments = scan_experiments()
+    assert scan_experiments(limit=3) == experiments[:3]
+    assert scan_experiments(limit=100) == experiments
+
+
 def test_scan_experiments_version_controlled(temp_furu_root: Path) -> None:
     """Test that scanner finds experiments in both roots."""
     # Create an unversioned experiment
@@ -17,6 +17,32 @@ def test_get_and_set_furu_root(furu_tmp_root, tmp_path, monkeypatch) -> None:
     assert furu.FURU_CONFIG.submitit_root == tmp_path.resolve() / "submitit"
 
 
+def test_get_root_is_cached_until_base_root_changes(furu_tmp_root, tmp_path) -> None:
+    data_root = furu.FURU_CONFIG.get_root()
+    assert furu.FURU_CONFIG.get_root() is data_root
+
+    furu.FURU_CONFIG.base_root = tmp_path / "elsewhere"
+    assert furu.FURU_CONFIG.get_root() == tmp_path / "elsewhere" / "data"
+
+
+def test_version_controlled_root_follows_cwd(tmp_path, monkeypatch) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for project_root in (first, second):
+        project_root.mkdir()
+        (project_root / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    monkeypatch.delenv("FURU_VERSION_CONTROLLED_PATH", raising=False)
+
+    monkeypatch.chdir(first)
+    config = FuruConfig()
+    assert config.get_root(version_controlled=True) == first / "furu-data" / "artifacts"
+
+    monkeypatch.chdir(second)
+    assert config.get_root(version_controlled=True) == (
+        second / "furu-data" / "artifacts"
+    )
+
+
 def test_default_base_root_uses_pyproject(tmp_path, monkeypatch) -> None:
     project_root = tmp_path / "repo"
     project_root.mkdir()
@@ -169,3 +195,14 @@ def test_max_wait_secs_from_env(monkeypatch) -> None:
     monkeypatch.setenv("FURU_MAX_WAIT_SECS", "123.5")
     config = FuruConfig()
     assert config.max_wait_time_sec == 123.5
+
+
+def test_dashboard_scan_workers_from_env(monkeypatch) -> None:
+    monkeypatch.delenv("FURU_DASHBOARD_SCAN_WORKERS", raising=False)
+    assert FuruConfig().dashboard_scan_workers == 1
+
+    monkeypatch.setenv("FURU_DASHBOARD_SCAN_WORKERS", "8")
+    assert FuruConfig().dashboard_scan_workers == 8
+
+    monkeypatch.setenv("FURU_DASHBOARD_SCAN_WORKERS", "0")
+    assert FuruConfig().dashboard_scan_workers == 1
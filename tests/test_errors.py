@@ -1,9 +1,12 @@
+import copy
 import json
+import pickle
 from typing import ClassVar
 
 import pytest
 
 import furu
+from furu.errors import MISSING, _FuruMissing
 from furu.storage.state import (
     _StateAttemptFailed,
     _StateResultFailed,
@@ -181,3 +184,22 @@ def test_get_recomputes_if_validate_returns_false(furu_tmp_root) -> None:
 
     assert obj.get() == 1
     assert (obj.furu_dir / "validated.txt").exists()
+
+
+def test_missing_is_a_pickle_stable_singleton() -> None:
+    assert _FuruMissing() is MISSING
+    assert pickle.loads(pickle.dumps(MISSING)) is MISSING
+    assert copy.deepcopy(MISSING) is MISSING
+    assert not MISSING
+
+
+def test_compute_error_str_is_cached(tmp_path) -> None:
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError as err:
+        original = err
+    error = furu.FuruComputeError("failed", tmp_path / ".furu" / "state.json", original)
+
+    text = str(error)
+    assert "RuntimeError: boom" in text
+    assert str(error) is text
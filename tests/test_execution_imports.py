@@ -1,4 +1,40 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
 def test_execution_imports() -> None:
     import furu.execution
 
     assert furu.execution is not None
+
+
+def test_import_furu_defers_submitit() -> None:
+    src = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "import sys, furu\n"
+        "assert 'submitit' not in sys.modules\n"
+        "assert furu.submitit is sys.modules['submitit']\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src)},
+    )
+
+
+def test_furu_version_is_resolved_lazily() -> None:
+    src = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "from importlib.metadata import version\n"
+        "import furu\n"
+        "assert '__version__' not in vars(furu)\n"
+        "assert furu.__version__ == version('furu')\n"
+        "assert vars(furu)['__version__'] == furu.__version__\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src)},
+    )
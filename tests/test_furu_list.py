@@ -28,3 +28,28 @@ def test_collection_dedup_and_lookup(furu_tmp_root) -> None:
     assert Experiments.by_name("a").value == 1
     assert Experiments.by_name("x").value == 2
     assert Experiments.by_name("missing", strict=False) is None
+
+
+def test_by_name_sees_attributes_added_later(furu_tmp_root) -> None:
+    class Late(furu.FuruList[Exp]):
+        first = Exp(value=1)
+
+    assert Late.by_name("second", strict=False) is None
+    Late.second = Exp(value=2)  # ty: ignore[unresolved-attribute]
+    assert Late.by_name("second").value == 2
+    del Late.second  # ty: ignore[unresolved-attribute]
+    assert Late.by_name("second", strict=False) is None
+
+
+def test_all_is_cached_until_attributes_change(furu_tmp_root) -> None:
+    class Late(furu.FuruList[Exp]):
+        first = Exp(value=1)
+
+    entries = Late.all()
+    entries.clear()
+    assert [exp.value for exp in Late.all()] == [1]
+
+    Late.second = Exp(value=2)  # ty: ignore[unresolved-attribute]
+    assert [exp.value for exp in Late] == [1, 2]
+    del Late.second  # ty: ignore[unresolved-attribute]
+    assert [exp.value for exp in Late.all()] == [1]
@@ -54,6 +54,19 @@ def test_hash_ignores_private_fields_in_config() -> None:
     )
 
 
+def test_compute_hash_shared_objects_match_distinct_copies() -> None:
+    shared = Foo(a=1, p=Path("x/y"))
+    with_shared = [shared, shared]
+    with_copies = [Foo(a=1, p=Path("x/y")), Foo(a=1, p=Path("x/y"))]
+    assert furu.FuruSerializer.compute_hash(
+        with_shared
+    ) == furu.FuruSerializer.compute_hash(with_copies)
+    # Equal-but-differently-typed values must still hash differently
+    assert furu.FuruSerializer.compute_hash(
+        Foo(a=1, p=Path("x"))
+    ) != furu.FuruSerializer.compute_hash(Foo(a=1.0, p=Path("x")))
+
+
 def test_to_python_is_evaluable() -> None:
     obj = Foo(a=3, p=Path("a/b"))
     code = furu.FuruSerializer.to_python(obj, multiline=False)